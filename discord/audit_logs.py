@@ -354,6 +354,25 @@ class AuditLogEntry(Hashable):
         which actions have this field filled out.
     """
 
+    __slots__ = (
+        '_state',
+        'guild',
+        '_users',
+        'action',
+        'id',
+        'reason',
+        'extra',
+        'user',
+        '_changes',
+        '_target_id',
+        '_cs_created_at',
+        '_cs_target',
+        '_cs_category',
+        '_cs_changes',
+        '_cs_before',
+        '_cs_after',
+    )
+
     def __init__(self, *, users: Dict[int, User], data: AuditLogEntryPayload, guild: Guild):
         self._state = guild._state
         self.guild = guild
@@ -440,12 +459,12 @@ class AuditLogEntry(Hashable):
     def __repr__(self) -> str:
         return f'<AuditLogEntry id={self.id} action={self.action} user={self.user!r}>'
 
-    @utils.cached_property
+    @utils.cached_slot_property('_cs_created_at')
     def created_at(self) -> datetime.datetime:
         """:class:`datetime.datetime`: Returns the entry's creation time in UTC."""
         return utils.snowflake_time(self.id)
 
-    @utils.cached_property
+    @utils.cached_slot_property('_cs_target')
     def target(self) -> Union[Guild, abc.GuildChannel, Member, User, Role, Invite, Emoji, StageInstance, GuildSticker, Thread, Object, None]:
         try:
             converter = getattr(self, '_convert_target_' + self.action.target_type)
@@ -454,24 +473,24 @@ class AuditLogEntry(Hashable):
         else:
             return converter(self._target_id)
 
-    @utils.cached_property
+    @utils.cached_slot_property('_cs_category')
     def category(self) -> enums.AuditLogActionCategory:
         """Optional[:class:`AuditLogActionCategory`]: The category of the action, if applicable."""
         return self.action.category
 
-    @utils.cached_property
+    @utils.cached_slot_property('_cs_changes')
     def changes(self) -> AuditLogChanges:
         """:class:`AuditLogChanges`: The list of changes this entry has."""
         obj = AuditLogChanges(self, self._changes)
         del self._changes
         return obj
 
-    @utils.cached_property
+    @utils.cached_slot_property('_cs_before')
     def before(self) -> AuditLogDiff:
         """:class:`AuditLogDiff`: The target's prior state."""
         return self.changes.before
 
-    @utils.cached_property
+    @utils.cached_slot_property('_cs_after')
     def after(self) -> AuditLogDiff:
         """:class:`AuditLogDiff`: The target's subsequent state."""
         return self.changes.after
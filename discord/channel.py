@@ -2039,43 +2039,46 @@ class PartialMessageable(discord.abc.Messageable, Hashable):
         return PartialMessage(channel=self, id=message_id)
 
 
+_GUILD_CHANNEL_TYPES: Dict[ChannelType, Type[Any]] = {
+    ChannelType.text: TextChannel,
+    ChannelType.voice: VoiceChannel,
+    ChannelType.category: CategoryChannel,
+    ChannelType.news: TextChannel,
+    ChannelType.store: StoreChannel,
+    ChannelType.stage_voice: StageChannel,
+}
+
+_PRIVATE_CHANNEL_TYPES: Dict[ChannelType, Type[Any]] = {
+    ChannelType.private: DMChannel,
+    ChannelType.group: GroupChannel,
+}
+
+_THREAD_CHANNEL_TYPES: Dict[ChannelType, Type[Any]] = {
+    ChannelType.private_thread: Thread,
+    ChannelType.public_thread: Thread,
+    ChannelType.news_thread: Thread,
+}
+
+_CHANNEL_TYPES: Dict[ChannelType, Type[Any]] = {**_GUILD_CHANNEL_TYPES, **_PRIVATE_CHANNEL_TYPES}
+_THREADED_CHANNEL_TYPES: Dict[ChannelType, Type[Any]] = {**_CHANNEL_TYPES, **_THREAD_CHANNEL_TYPES}
+_THREADED_GUILD_CHANNEL_TYPES: Dict[ChannelType, Type[Any]] = {**_GUILD_CHANNEL_TYPES, **_THREAD_CHANNEL_TYPES}
+
+
 def _guild_channel_factory(channel_type: int):
     value = try_enum(ChannelType, channel_type)
-    if value is ChannelType.text:
-        return TextChannel, value
-    elif value is ChannelType.voice:
-        return VoiceChannel, value
-    elif value is ChannelType.category:
-        return CategoryChannel, value
-    elif value is ChannelType.news:
-        return TextChannel, value
-    elif value is ChannelType.store:
-        return StoreChannel, value
-    elif value is ChannelType.stage_voice:
-        return StageChannel, value
-    else:
-        return None, value
+    return _GUILD_CHANNEL_TYPES.get(value), value
 
 
 def _channel_factory(channel_type: int):
-    cls, value = _guild_channel_factory(channel_type)
-    if value is ChannelType.private:
-        return DMChannel, value
-    elif value is ChannelType.group:
-        return GroupChannel, value
-    else:
-        return cls, value
+    value = try_enum(ChannelType, channel_type)
+    return _CHANNEL_TYPES.get(value), value
 
 
 def _threaded_channel_factory(channel_type: int):
-    cls, value = _channel_factory(channel_type)
-    if value in (ChannelType.private_thread, ChannelType.public_thread, ChannelType.news_thread):
-        return Thread, value
-    return cls, value
+    value = try_enum(ChannelType, channel_type)
+    return _THREADED_CHANNEL_TYPES.get(value), value
 
 
 def _threaded_guild_channel_factory(channel_type: int):
-    cls, value = _guild_channel_factory(channel_type)
-    if value in (ChannelType.private_thread, ChannelType.public_thread, ChannelType.news_thread):
-        return Thread, value
-    return cls, value
+    value = try_enum(ChannelType, channel_type)
+    return _THREADED_GUILD_CHANNEL_TYPES.get(value), value
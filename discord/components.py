@@ -174,11 +174,8 @@ class Button(Component):
         self.url: Optional[str] = data.get('url')
         self.disabled: bool = data.get('disabled', False)
         self.label: Optional[str] = data.get('label')
-        self.emoji: Optional[PartialEmoji]
-        try:
-            self.emoji = PartialEmoji.from_dict(data['emoji'])
-        except KeyError:
-            self.emoji = None
+        emoji_data = data.get('emoji')
+        self.emoji: Optional[PartialEmoji] = PartialEmoji.from_dict(emoji_data) if emoji_data is not None else None
 
     def to_dict(self) -> ButtonComponentPayload:
         payload = {
@@ -341,10 +338,8 @@ class SelectOption:
 
     @classmethod
     def from_dict(cls, data: SelectOptionPayload) -> SelectOption:
-        try:
-            emoji = PartialEmoji.from_dict(data['emoji'])
-        except KeyError:
-            emoji = None
+        emoji_data = data.get('emoji')
+        emoji = PartialEmoji.from_dict(emoji_data) if emoji_data is not None else None
 
         return cls(
             label=data['label'],
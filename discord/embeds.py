@@ -28,6 +28,7 @@ import datetime
 from typing import Any, Dict, Final, List, Mapping, Protocol, TYPE_CHECKING, Type, TypeVar, Union
 
 from . import utils
+from .utils import MISSING
 from .colour import Colour
 
 __all__ = (
@@ -682,13 +683,12 @@ class Embed:
         """Converts this embed object into a dict."""
 
         # add in the raw data into the dict
-        # fmt: off
-        result = {
-            key[1:]: getattr(self, key)
-            for key in self.__slots__
-            if key[0] == '_' and hasattr(self, key)
-        }
-        # fmt: on
+        result = {}
+        for key in self.__slots__:
+            if key[0] == '_':
+                value = getattr(self, key, MISSING)
+                if value is not MISSING:
+                    result[key[1:]] = value
 
         # deal with basic convenience wrappers
 
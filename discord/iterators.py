@@ -186,7 +186,7 @@ class ReactionIterator(_AsyncIterator[Union['User', 'Member']]):
     def __init__(self, message, emoji, limit=100, after=None):
         self.message = message
         self.limit = limit
-        self.after = after
+        self.after_id: Optional[int] = after.id if after is not None else None
         state = message._state
         self.getter = state.http.get_reaction_users
         self.state = state
@@ -204,33 +204,55 @@ class ReactionIterator(_AsyncIterator[Union['User', 'Member']]):
         except asyncio.QueueEmpty:
             raise NoMoreItems()
 
+    async def _retrieve_users(self) -> List[PartialUserPayload]:
+        retrieve = self.limit if self.limit <= 100 else 100
+
+        data: List[PartialUserPayload] = await self.getter(
+            self.channel_id, self.message.id, self.emoji, retrieve, after=self.after_id
+        )
+
+        if data:
+            self.limit -= retrieve
+            self.after_id = int(data[-1]['id'])
+
+        return data
+
     async def fill_users(self):
         # this is a hack because >circular imports<
         from .user import User
 
-        if self.limit > 0:
-            retrieve = self.limit if self.limit <= 100 else 100
+        if self.limit <= 0:
+            return
 
-            after = self.after.id if self.after else None
-            data: List[PartialUserPayload] = await self.getter(
-                self.channel_id, self.message.id, self.emoji, retrieve, after=after
-            )
+        data = await self._retrieve_users()
 
-            if data:
-                self.limit -= retrieve
-                self.after = Object(id=int(data[-1]['id']))
+        state = self.state
+        guild = self.guild
+        put = self.users.put_nowait
+        get_user = state.get_user
 
-            if self.guild is None or isinstance(self.guild, Object):
-                for element in reversed(data):
-                    await self.users.put(User(state=self.state, data=element))
-            else:
-                for element in reversed(data):
-                    member_id = int(element['id'])
-                    member = self.guild.get_member(member_id)
-                    if member is not None:
-                        await self.users.put(member)
-                    else:
-                        await self.users.put(User(state=self.state, data=element))
+        def to_user(element: PartialUserPayload) -> User:
+            # reuse users that are already cached without growing the cache,
+            # the cache also holds the ClientUser which must not be yielded here
+            user = get_user(int(element['id']))
+            if isinstance(user, User):
+                return user
+            return User(state=state, data=element)
+
+        # _retrieve_users has already taken the after cursor from the last element
+        data.reverse()
+
+        if guild is None or isinstance(guild, Object):
+            for element in data:
+                put(to_user(element))
+        else:
+            get_member = guild.get_member
+            for element in data:
+                member = get_member(int(element['id']))
+                if member is not None:
+                    put(member)
+                else:
+                    put(to_user(element))
 
 
 class HistoryIterator(_AsyncIterator['Message']):
@@ -848,28 +848,25 @@ class Message(Hashable):
             self.author = Member._from_message(message=self, data=member)
 
     def _handle_mentions(self, mentions: List[UserWithMemberPayload]) -> None:
-        self.mentions = r = []
         guild = self.guild
         state = self._state
         if not isinstance(guild, Guild):
             self.mentions = [state.store_user(m) for m in mentions]
             return
 
-        for mention in filter(None, mentions):
-            id_search = int(mention['id'])
-            member = guild.get_member(id_search)
-            if member is not None:
-                r.append(member)
-            else:
-                r.append(Member._try_upgrade(data=mention, guild=guild, state=state))
+        get_member = guild.get_member
+        self.mentions = [
+            get_member(int(mention['id'])) or Member._try_upgrade(data=mention, guild=guild, state=state)
+            for mention in filter(None, mentions)
+        ]
 
     def _handle_mention_roles(self, role_mentions: List[int]) -> None:
-        self.role_mentions = []
-        if isinstance(self.guild, Guild):
-            for role_id in map(int, role_mentions):
-                role = self.guild.get_role(role_id)
-                if role is not None:
-                    self.role_mentions.append(role)
+        if not isinstance(self.guild, Guild):
+            self.role_mentions = []
+            return
+
+        get_role = self.guild.get_role
+        self.role_mentions = [role for role in map(get_role, map(int, role_mentions)) if role is not None]
 
     def _handle_components(self, components: List[ComponentPayload]):
         self.components = [_component_factory(d) for d in components]